@@ -10,9 +10,10 @@ Exit codes:
   0 - Success (marker written or no action needed)
 """
 import json
+import os
 import sys
+import time
 from pathlib import Path
-from datetime import datetime, timezone
 
 
 def main():
@@ -37,10 +38,26 @@ def main():
     marker_data = {
         "newSessionId": session_id,
         "cwd": cwd,
-        "compactedAt": datetime.now(timezone.utc).isoformat(),
+        # time.strftime on gmtime skips the datetime + tzinfo allocation;
+        # the daemon just feeds this to new Date(), which parses Z fine
+        "compactedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
     }
 
-    marker_file.write_text(json.dumps(marker_data, indent=2))
+    # Compact JSON and a single write(2): the daemon parses this
+    # programmatically, so pretty-printing is wasted bytes, and Claude Code
+    # blocks on this hook before the session starts.
+    #
+    # Write to a .tmp sibling and rename into place: the daemon watches for
+    # compacted.*.marker, so the marker must appear atomically (the .tmp
+    # suffix does not match its pattern).
+    payload = json.dumps(marker_data, separators=(",", ":")).encode()
+    tmp_file = claude_dir / f"compacted.{session_id}.marker.tmp"
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+    os.replace(tmp_file, marker_file)
     sys.exit(0)
 
 
@@ -4,32 +4,110 @@ UserPromptSubmit hook that suggests relevant skills based on prompt keywords.
 Dynamically reads skill triggers from SKILL.md files.
 """
 import json
+import os
+import pickle
 import re
 import sys
+import tempfile
 from pathlib import Path
 
+# Common important terms scanned for in "Use when" descriptions, built once
+# instead of per extract_triggers() call
+USE_WHEN_TERMS: tuple[str, ...] = (
+    "async",
+    "frontend",
+    "design",
+    "testing",
+    "playwright",
+    "next.js",
+    "tanstack",
+    "prompt",
+    "ux",
+    "api",
+    "websocket",
+    "dashboard",
+    "table",
+    "form",
+    "component",
+)
+
+# Extracted triggers are cached on disk keyed by each SKILL.md's
+# (mtime_ns, size), so repeat invocations skip the regex parsing until a
+# skill file actually changes. Maps skill name -> (stat key, triggers).
+CACHE_FILE = Path.home() / ".claude" / "skills" / ".triggers-cache.pkl"
+
+
+def load_trigger_cache() -> dict[str, tuple[tuple[int, int], list[str]]]:
+    """Load the trigger cache, returning an empty cache on any failure."""
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            cache = pickle.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        # A corrupt/truncated pickle can raise ValueError, TypeError,
+        # UnicodeDecodeError, ImportError, ... - any failure just means a
+        # fresh parse, so never let a bad cache file break the hook
+        return {}
+
+
+def save_trigger_cache(cache: dict[str, tuple[tuple[int, int], list[str]]]) -> None:
+    """Write the trigger cache atomically; failures are non-fatal."""
+    try:
+        # Unique tmp name per invocation: concurrent hook runs must not
+        # interleave writes to a shared tmp file before the rename
+        fd, tmp = tempfile.mkstemp(dir=CACHE_FILE.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(cache, f)
+            os.replace(tmp, CACHE_FILE)
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass  # Cache is an optimization only; never block the hook
+
 
 def load_skills() -> dict[str, list[str]]:
     """Load skill names and their trigger keywords from SKILL.md files."""
     skills_dir = Path.home() / ".claude" / "skills"
     skills = {}
 
-    if not skills_dir.exists():
+    # One scandir gives us all entries with their type cached from the
+    # dirent, instead of a stat per entry via iterdir()/is_dir()
+    try:
+        entries = [e for e in os.scandir(skills_dir) if e.is_dir()]
+    except FileNotFoundError:
         return skills
 
-    for skill_dir in skills_dir.iterdir():
-        if not skill_dir.is_dir():
-            continue
+    cache = load_trigger_cache()
+    cache_dirty = False
 
-        skill_md = skill_dir / "SKILL.md"
-        if not skill_md.exists():
+    for entry in entries:
+        skill_md = Path(entry.path) / "SKILL.md"
+
+        # A single stat doubles as existence check and cache key
+        try:
+            stat = skill_md.stat()
+        except FileNotFoundError:
             continue
 
-        skill_name = skill_dir.name
-        triggers = extract_triggers(skill_md)
+        skill_name = entry.name
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        cached = cache.get(skill_name)
+        if cached is not None and cached[0] == stat_key:
+            triggers = cached[1]
+        else:
+            triggers = extract_triggers(skill_md)
+            cache[skill_name] = (stat_key, triggers)
+            cache_dirty = True
+
         if triggers:
             skills[skill_name] = triggers
 
+    if cache_dirty:
+        save_trigger_cache(cache)
+
     return skills
 
 
@@ -60,28 +138,7 @@ def extract_triggers(skill_md: Path) -> list[str]:
     if match:
         # Extract key terms from the description
         text = match.group(1).lower()
-        keywords = []
-        # Common important terms
-        for term in [
-            "async",
-            "frontend",
-            "design",
-            "testing",
-            "playwright",
-            "next.js",
-            "tanstack",
-            "prompt",
-            "ux",
-            "api",
-            "websocket",
-            "dashboard",
-            "table",
-            "form",
-            "component",
-        ]:
-            if term in text:
-                keywords.append(term)
-        return keywords
+        return [term for term in USE_WHEN_TERMS if term in text]
 
     return []
 
@@ -12,34 +12,23 @@ Exit codes:
 """
 import json
 import sys
-from datetime import datetime, timezone
+import time
 
+STATUS_FILE = ".claude/status.md"
 
-def main():
-    try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
-        # Can't parse input, allow stop to prevent blocking
-        sys.exit(0)
-
-    stop_hook_active = input_data.get("stop_hook_active", False)
+# The instructions are static except for the timestamp. Pre-render them as
+# bytes at import so each invocation (this hook fires on every stop) only
+# splices the timestamp instead of re-formatting ~40 lines of boilerplate.
+_HEAD = f"""Before stopping, update your session status:
 
-    # Loop prevention: if we already blocked once, allow stop
-    if stop_hook_active:
-        sys.exit(0)
-
-    # Generate deterministic values
-    status_file = ".claude/status.md"
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-    instructions = f"""Before stopping, update your session status:
-
-1. UPDATE STATUS FILE at: {status_file}
+1. UPDATE STATUS FILE at: {STATUS_FILE}
 
 ```markdown
 ---
 status: [completed|error|blocked|waiting_for_input]
-updated: {timestamp}
+updated: """.encode()
+
+_TAIL = b"""
 task: [What was the task - 5-10 words]
 ---
 
@@ -65,9 +54,32 @@ task: [What was the task - 5-10 words]
    - Update .claude/MEMORIES.md (if significant learnings)
    - Commit and push (if requested)
 
-After updating status file, you may stop."""
+After updating status file, you may stop.
+"""
+
+
+def main():
+    try:
+        input_data = json.load(sys.stdin)
+    except json.JSONDecodeError:
+        # Can't parse input, allow stop to prevent blocking
+        sys.exit(0)
+
+    stop_hook_active = input_data.get("stop_hook_active", False)
+
+    # Loop prevention: if we already blocked once, allow stop
+    if stop_hook_active:
+        sys.exit(0)
+
+    # Generate deterministic values; time.strftime on gmtime skips the
+    # datetime object + tzinfo allocation
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
-    print(instructions, file=sys.stderr)
+    out = sys.stderr.buffer
+    out.write(_HEAD)
+    out.write(timestamp.encode())
+    out.write(_TAIL)
+    out.flush()
     sys.exit(2)
 
 
@@ -10,26 +10,21 @@ Exit codes:
 """
 import json
 import sys
-from datetime import datetime, timezone
+import time
 
+STATUS_FILE = ".claude/status.md"
 
-def main():
-    try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
-        sys.exit(0)
-
-    # Generate deterministic values
-    status_file = ".claude/status.md"
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-    # Template for model to fill - minimal decisions required
-    template = f"""Update project status file at: {status_file}
+# The template is static except for the timestamp. Pre-render it as bytes
+# at import so each invocation (this hook fires on every user prompt) only
+# splices the timestamp instead of re-formatting the boilerplate.
+_HEAD = f"""Update project status file at: {STATUS_FILE}
 
 ```markdown
 ---
 status: working
-updated: {timestamp}
+updated: """.encode()
+
+_TAIL = b"""
 task: [Brief description of this task - 5-10 words]
 ---
 
@@ -40,9 +35,25 @@ task: [Brief description of this task - 5-10 words]
 [What needs to happen to complete this task]
 ```
 
-Create this file (mkdir -p .claude if needed) before starting work."""
+Create this file (mkdir -p .claude if needed) before starting work.
+"""
+
+
+def main():
+    try:
+        input_data = json.load(sys.stdin)
+    except json.JSONDecodeError:
+        sys.exit(0)
+
+    # Generate deterministic values; time.strftime on gmtime skips the
+    # datetime object + tzinfo allocation
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
-    print(template)
+    out = sys.stdout.buffer
+    out.write(_HEAD)
+    out.write(timestamp.encode())
+    out.write(_TAIL)
+    out.flush()
     sys.exit(0)
 
 
@@ -9,32 +9,43 @@ Exit codes:
   0 - Allow stop
   2 - Block stop (stderr shown to Claude)
 """
+# re, subprocess and concurrent.futures are imported lazily: the common
+# path (re-entry with stop_hook_active set) exits before any pattern
+# matching or git work, so only json/sys are paid on every invocation.
 import json
-import re
-import subprocess
 import sys
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ChangePattern:
+    """A change type's detection patterns and testing requirements."""
+
+    patterns: tuple[str, ...]
+    name: str
+    tests: tuple[str, ...]
 
 
 # Change type patterns and their testing requirements
-CHANGE_PATTERNS: dict[str, dict] = {
-    "env_var": {
-        "patterns": [
+CHANGE_PATTERNS: dict[str, ChangePattern] = {
+    "env_var": ChangePattern(
+        patterns=(
             r"NEXT_PUBLIC_",
             r"process\.env\.",
             r"\.env",
             r"os\.environ",
             r"os\.getenv",
-        ],
-        "name": "ENV VAR CHANGES",
-        "tests": [
+        ),
+        name="ENV VAR CHANGES",
+        tests=(
             "Grep for fallback patterns: || 'http://localhost'",
             "Test with production config: NEXT_PUBLIC_API_BASE='' npm run dev",
             "Check Network tab for any localhost requests",
             "Run /config-audit for deeper analysis",
-        ],
-    },
-    "auth": {
-        "patterns": [
+        ),
+    ),
+    "auth": ChangePattern(
+        patterns=(
             r"clearToken",
             r"removeToken",
             r"deleteToken",
@@ -44,17 +55,17 @@ CHANGE_PATTERNS: dict[str, dict] = {
             r"AuthContext",
             r"token.*clear",
             r"session.*destroy",
-        ],
-        "name": "AUTH CHANGES",
-        "tests": [
+        ),
+        name="AUTH CHANGES",
+        tests=(
             "Trace all paths to token clearing functions",
             "Test auth cascade: what happens on 401 response?",
             "Verify network failures don't incorrectly clear auth state",
             "Test login/logout flow end-to-end",
-        ],
-    },
-    "link": {
-        "patterns": [
+        ),
+    ),
+    "link": ChangePattern(
+        patterns=(
             r"<Link",
             r'href="/',
             r"href='/'",
@@ -62,49 +73,49 @@ CHANGE_PATTERNS: dict[str, dict] = {
             r"router\.replace",
             r"navigate\(",
             r"useNavigate",
-        ],
-        "name": "LINK/ROUTE CHANGES",
-        "tests": [
+        ),
+        name="LINK/ROUTE CHANGES",
+        tests=(
             "Run: python tools/validate_links.py <frontend_dir>",
             "Verify target routes exist in app/ directory",
             "Test navigation in browser",
-        ],
-    },
-    "api_route": {
-        "patterns": [
+        ),
+    ),
+    "api_route": ChangePattern(
+        patterns=(
             r"@app\.(get|post|put|delete|patch)",
             r"@router\.(get|post|put|delete|patch)",
             r"APIRouter",
             r"app/api/.*route",
             r"FastAPI",
-        ],
-        "name": "API ROUTE CHANGES",
-        "tests": [
+        ),
+        name="API ROUTE CHANGES",
+        tests=(
             "Test through proxy (not direct localhost)",
             "Check for 307 trailing slash redirects",
             "Verify Authorization headers survive redirects",
             "Test with curl through actual endpoint",
-        ],
-    },
-    "websocket": {
-        "patterns": [
+        ),
+    ),
+    "websocket": ChangePattern(
+        patterns=(
             r"WebSocket",
             r"wss://",
             r"ws://",
             r"useWebSocket",
             r"socket\.on",
             r"socket\.emit",
-        ],
-        "name": "WEBSOCKET CHANGES",
-        "tests": [
+        ),
+        name="WEBSOCKET CHANGES",
+        tests=(
             "Test with production WebSocket URL, not localhost",
             "Check for fallback patterns in WS URL construction",
             "Verify reconnection logic works",
             "Check browser console for WS connection errors",
-        ],
-    },
-    "database": {
-        "patterns": [
+        ),
+    ),
+    "database": ChangePattern(
+        patterns=(
             r"CREATE TABLE",
             r"ALTER TABLE",
             r"DROP TABLE",
@@ -112,34 +123,34 @@ CHANGE_PATTERNS: dict[str, dict] = {
             r"\.sql$",
             r"prisma migrate",
             r"alembic",
-        ],
-        "name": "DATABASE CHANGES",
-        "tests": [
+        ),
+        name="DATABASE CHANGES",
+        tests=(
             "Run migrations in dev environment first",
             "Verify rollback works",
             "Check for data integrity after migration",
             "Test with production-like data volume",
-        ],
-    },
-    "proxy": {
-        "patterns": [
+        ),
+    ),
+    "proxy": ChangePattern(
+        patterns=(
             r"proxy",
             r"rewrites",
             r"next\.config",
             r"nginx",
             r"CORS",
             r"Access-Control",
-        ],
-        "name": "PROXY/CORS CHANGES",
-        "tests": [
+        ),
+        name="PROXY/CORS CHANGES",
+        tests=(
             "Test full request flow through proxy",
             "Verify headers are preserved (especially Authorization)",
             "Check for redirect loops",
             "Test from browser, not just curl",
-        ],
-    },
-    "datetime_boundary": {
-        "patterns": [
+        ),
+    ),
+    "datetime_boundary": ChangePattern(
+        patterns=(
             r"datetime",
             r"timezone",
             r"tzinfo",
@@ -147,17 +158,17 @@ CHANGE_PATTERNS: dict[str, dict] = {
             r"xlsxwriter",
             r"pandas.*to_excel",
             r"\.xls",
-        ],
-        "name": "DATETIME/EXCEL BOUNDARY CHANGES",
-        "tests": [
+        ),
+        name="DATETIME/EXCEL BOUNDARY CHANGES",
+        tests=(
             "Use tz-aware datetimes in tests: datetime.now(timezone.utc)",
             "Test with real DB objects, not mocks (PostgreSQL returns tz-aware)",
             "Add contract test: assert dt.tzinfo is None before Excel export",
             "Check: does code handle both naive and tz-aware inputs?",
-        ],
-    },
-    "serialization_boundary": {
-        "patterns": [
+        ),
+    ),
+    "serialization_boundary": ChangePattern(
+        patterns=(
             r"\.to_dict",
             r"\.model_dump",
             r"json\.dumps",
@@ -165,17 +176,17 @@ CHANGE_PATTERNS: dict[str, dict] = {
             r"StreamingResponse",
             r"FileResponse",
             r"BytesIO",
-        ],
-        "name": "SERIALIZATION BOUNDARY CHANGES",
-        "tests": [
+        ),
+        name="SERIALIZATION BOUNDARY CHANGES",
+        tests=(
             "Test with production data types (UUID objects, Decimal, datetime)",
             "Verify JSON serialization doesn't lose type info",
             "Check: custom encoders for non-JSON-native types?",
             "E2E test: parse the actual output, not just status code",
-        ],
-    },
-    "orm_boundary": {
-        "patterns": [
+        ),
+    ),
+    "orm_boundary": ChangePattern(
+        patterns=(
             r"\.query\(",
             r"\.filter\(",
             r"\.all\(\)",
@@ -183,68 +194,90 @@ CHANGE_PATTERNS: dict[str, dict] = {
             r"session\.",
             r"db_session",
             r"AsyncSession",
-        ],
-        "name": "ORM/DATABASE BOUNDARY CHANGES",
-        "tests": [
+        ),
+        name="ORM/DATABASE BOUNDARY CHANGES",
+        tests=(
             "Integration test with real DB, not mocked queries",
             "Test data should match DB column types exactly",
             "Check: datetime columns → tz-aware in PostgreSQL",
             "Check: UUID columns → UUID objects, not strings",
-        ],
-    },
-    "file_export": {
-        "patterns": [
+        ),
+    ),
+    "file_export": ChangePattern(
+        patterns=(
             r"build_excel",
             r"to_csv",
             r"to_excel",
             r"write.*xlsx",
             r"Workbook\(",
             r"csv\.writer",
-        ],
-        "name": "FILE EXPORT CHANGES",
-        "tests": [
+        ),
+        name="FILE EXPORT CHANGES",
+        tests=(
             "Test export with production-like data (tz-aware dates, UUIDs)",
             "Actually parse the output file in tests, don't just check size",
             "Property test: handle both naive and tz-aware datetime inputs",
             "Boundary test: verify data survives round-trip (export → import)",
-        ],
-    },
+        ),
+    ),
 }
 
 
+# Compiled on first use and cached: one alternation regex per change type,
+# so each detect_change_types() call does a single scan of the diff per
+# type instead of one re.search per pattern.
+_COMPILED_PATTERNS: dict[str, "re.Pattern[str]"] | None = None
+
+
+def compiled_patterns() -> dict[str, "re.Pattern[str]"]:
+    """Compile the change-type patterns once, on first use."""
+    global _COMPILED_PATTERNS
+    if _COMPILED_PATTERNS is None:
+        import re
+
+        _COMPILED_PATTERNS = {
+            change_type: re.compile(
+                "|".join(f"(?:{p})" for p in config.patterns), re.IGNORECASE
+            )
+            for change_type, config in CHANGE_PATTERNS.items()
+        }
+    return _COMPILED_PATTERNS
+
+
+def run_git(args: list[str]) -> str:
+    """Run a git command and return its stdout."""
+    import subprocess
+
+    result = subprocess.run(
+        ["git", *args],
+        capture_output=True,
+        text=True,
+        timeout=5,
+    )
+    return result.stdout
+
+
 def get_git_diff() -> str:
     """Get combined staged and unstaged git diff."""
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
+
     try:
-        # Get both staged and unstaged changes
-        staged = subprocess.run(
-            ["git", "diff", "--cached", "--name-only"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        unstaged = subprocess.run(
-            ["git", "diff", "--name-only"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-
-        # Also get the actual diff content for pattern matching
-        diff_content = subprocess.run(
-            ["git", "diff", "--cached"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        unstaged_content = subprocess.run(
-            ["git", "diff"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-
-        files = staged.stdout + "\n" + unstaged.stdout
-        content = diff_content.stdout + "\n" + unstaged_content.stdout
+        # The four git calls are independent, so overlap them: total latency
+        # becomes the slowest call instead of the sum of all four.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            staged, unstaged, diff_content, unstaged_content = executor.map(
+                run_git,
+                [
+                    ["diff", "--cached", "--name-only"],  # staged file names
+                    ["diff", "--name-only"],  # unstaged file names
+                    ["diff", "--cached"],  # staged diff content
+                    ["diff"],  # unstaged diff content
+                ],
+            )
+
+        files = staged + "\n" + unstaged
+        content = diff_content + "\n" + unstaged_content
         return files + "\n" + content
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return ""
@@ -252,15 +285,15 @@ def get_git_diff() -> str:
 
 def detect_change_types(diff: str) -> list[str]:
     """Detect which types of changes were made based on diff content."""
-    detected = []
-
-    for change_type, config in CHANGE_PATTERNS.items():
-        for pattern in config["patterns"]:
-            if re.search(pattern, diff, re.IGNORECASE):
-                detected.append(change_type)
-                break  # Only add each type once
+    # Clean tree (or git unavailable): skip all the regex scans outright
+    if not diff.strip():
+        return []
 
-    return detected
+    return [
+        change_type
+        for change_type, pattern in compiled_patterns().items()
+        if pattern.search(diff)
+    ]
 
 
 def format_change_specific_tests(change_types: list[str]) -> str:
@@ -272,8 +305,8 @@ def format_change_specific_tests(change_types: list[str]) -> str:
 
     for change_type in change_types:
         config = CHANGE_PATTERNS[change_type]
-        lines.append(f"\n   ⚠️  {config['name']} DETECTED:")
-        for test in config["tests"]:
+        lines.append(f"\n   ⚠️  {config.name} DETECTED:")
+        for test in config.tests:
             lines.append(f"      - {test}")
 
     return "\n".join(lines)
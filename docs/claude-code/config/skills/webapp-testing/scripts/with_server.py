@@ -89,11 +89,13 @@ def main():
         sys.exit(result.returncode)
 
     finally:
-        # Clean up all servers
+        # Clean up all servers: signal everything first, then reap, so slow
+        # shutdowns overlap instead of costing up to 5s per server in sequence
         print(f"\nStopping {len(server_processes)} server(s)...")
+        for process in server_processes:
+            process.terminate()
         for i, process in enumerate(server_processes):
             try:
-                process.terminate()
                 process.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 process.kill()